@@ -2,8 +2,6 @@
 
 """Module containing the Template class and the command line interface."""
 import argparse
-import shutil
-from pathlib import PurePath
 from biobb_common.generic.biobb_object import BiobbObject
 from biobb_common.configuration import settings
 from biobb_common.tools import file_utils as fu
@@ -89,36 +87,26 @@ class Template(BiobbObject):
             return 0
         self.stage_files()
 
-        # Creating temporary folder
-        self.tmp_folder = fu.create_unique_dir()
-        fu.log('Creating %s temporary folder' % self.tmp_folder, self.out_log)
-
-        # 5. Include here all mandatory input files
-        # Copy input_file_path1 to temporary folder
-        shutil.copy(self.io_dict['in']['input_file_path1'], self.tmp_folder)
-
-        # 6. Prepare the command line parameters as instructions list
+        # 5. Prepare the command line parameters as instructions list
         instructions = ['-j']
         if self.boolean_property:
             instructions.append('-v')
             fu.log('Appending optional boolean property', self.out_log, self.global_log)
 
-        # 7. Build the actual command line as a list of items (elements order will be maintained)
+        # 6. Build the actual command line as a list of items (elements order will be maintained)
         self.cmd = [self.binary_path,
-                    ' '.join(instructions),
-                    self.io_dict['out']['output_file_path'],
-                    str(PurePath(self.tmp_folder).joinpath(PurePath(self.io_dict['in']['input_file_path1']).name))]
+                    *instructions,
+                    self.stage_io_dict['out']['output_file_path'],
+                    self.stage_io_dict['in']['input_file_path1']]
         fu.log('Creating command line with instructions and required arguments', self.out_log, self.global_log)
 
-        # 8. Repeat for optional input files if provided
-        if self.io_dict['in']['input_file_path2']:
-            # Copy input_file_path2 to temporary folder
-            shutil.copy(self.io_dict['in']['input_file_path2'], self.tmp_folder)
+        # 7. Repeat for optional input files if provided
+        if self.stage_io_dict['in'].get('input_file_path2'):
             # Append optional input_file_path2 to cmd
-            self.cmd.append(str(PurePath(self.tmp_folder).joinpath(PurePath(self.io_dict['in']['input_file_path2']).name)))
+            self.cmd.append(self.stage_io_dict['in']['input_file_path2'])
             fu.log('Appending optional argument to command line', self.out_log, self.global_log)
 
-        # 9. Uncomment to check the command line
+        # 8. Uncomment to check the command line
         # print(' '.join(cmd))
 
         # Run Biobb block
@@ -129,8 +117,7 @@ class Template(BiobbObject):
 
         # Remove temporary file(s)
         self.tmp_files.extend([
-            self.stage_io_dict.get("unique_dir"),
-            self.tmp_folder
+            self.stage_io_dict.get("unique_dir")
         ])
         self.remove_tmp_files()
 
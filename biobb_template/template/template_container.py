@@ -96,10 +96,6 @@ class TemplateContainer(BiobbObject):
             return 0
         self.stage_files()
 
-        # Creating temporary folder
-        self.tmp_folder = fu.create_unique_dir()
-        fu.log('Creating %s temporary folder' % self.tmp_folder, self.out_log)
-
         # 5. Prepare the command line parameters as instructions list
         instructions = ['-j']
         if self.boolean_property:
@@ -108,7 +104,7 @@ class TemplateContainer(BiobbObject):
 
         # 6. Build the actual command line as a list of items (elements order will be maintained)
         self.cmd = [self.binary_path,
-                    ' '.join(instructions),
+                    *instructions,
                     self.stage_io_dict['out']['output_file_path'],
                     self.stage_io_dict['in']['input_file_path1']]
         fu.log('Creating command line with instructions and required arguments', self.out_log, self.global_log)
@@ -130,8 +126,7 @@ class TemplateContainer(BiobbObject):
 
         # Remove temporary file(s)
         self.tmp_files.extend([
-            self.stage_io_dict.get("unique_dir"),
-            self.tmp_folder
+            self.stage_io_dict.get("unique_dir")
         ])
         self.remove_tmp_files()
 
@@ -1,3 +1,4 @@
+from pathlib import Path
 from biobb_common.tools import test_fixtures as fx
 from biobb_template.template.template import template
 
@@ -15,3 +16,22 @@ class TestTemplate():
         assert fx.not_empty(self.paths['output_file_path'])
         assert fx.equal(self.paths['output_file_path'], self.paths['ref_output_file_path'])
         assert fx.exe_success(returncode)
+
+
+class TestTemplateSameBasename():
+    def setup_class(self):
+        fx.test_setup(self, 'template_same_basename')
+        self.input_contents = {key: Path(self.paths[key]).read_bytes() for key in ('input_file_path1', 'input_file_path2')}
+
+    def teardown_class(self):
+        fx.test_teardown(self)
+        pass
+
+    def test_template_same_basename(self):
+        returncode = template(properties=self.properties, **self.paths)
+        assert fx.not_empty(self.paths['output_file_path'])
+        assert fx.exe_success(returncode)
+        # Original input files must be left untouched
+        for key, content in self.input_contents.items():
+            assert Path(self.paths[key]).read_bytes() == content
+        # Note: both inputs are staged under the same name, so the archive only keeps one of them